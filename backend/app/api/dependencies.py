@@ -3,7 +3,11 @@
 from functools import lru_cache
 
 from app.config import settings
+from app.services.executor import ValidationExecutor
+from app.services.result_cache import ValidationResultCache
 from app.services.scenario_service import ScenarioService
+from app.services.single_flight import SingleFlight
+from app.services.validation_runner import ValidationRunner
 from app.services.validation_service import ValidationService
 
 
@@ -17,3 +21,41 @@ def get_scenario_service() -> ScenarioService:
 def get_validation_service() -> ValidationService:
     """Get the validation service singleton."""
     return ValidationService()
+
+
+@lru_cache
+def get_validation_executor() -> ValidationExecutor:
+    """Get the validation executor singleton."""
+    return ValidationExecutor(
+        get_validation_service(),
+        backend=settings.validation_backend,
+        workers=settings.validation_workers,
+        scenarios_path=settings.scenarios_path,
+    )
+
+
+@lru_cache
+def get_result_cache() -> ValidationResultCache:
+    """Get the validation result cache singleton."""
+    return ValidationResultCache(
+        max_entries=settings.validation_cache_size,
+        ttl_seconds=settings.validation_cache_ttl_seconds,
+    )
+
+
+@lru_cache
+def get_single_flight() -> SingleFlight:
+    """Get the in-flight validation coalescer singleton."""
+    return SingleFlight()
+
+
+@lru_cache
+def get_validation_runner() -> ValidationRunner:
+    """Get the validation runner singleton."""
+    return ValidationRunner(
+        get_scenario_service(),
+        get_validation_executor(),
+        get_result_cache(),
+        get_single_flight(),
+        concurrency=settings.batch_concurrency,
+    )
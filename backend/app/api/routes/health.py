@@ -2,9 +2,11 @@
 
 from fastapi import APIRouter, Depends
 
-from app.api.dependencies import get_scenario_service
+from app.api.dependencies import get_result_cache, get_scenario_service, get_single_flight
 from app.config import settings
+from app.services.result_cache import ValidationResultCache
 from app.services.scenario_service import ScenarioService
+from app.services.single_flight import SingleFlight
 
 router = APIRouter()
 
@@ -12,10 +14,14 @@ router = APIRouter()
 @router.get("/health")
 async def health_check(
     scenario_service: ScenarioService = Depends(get_scenario_service),
+    cache: ValidationResultCache = Depends(get_result_cache),
+    single_flight: SingleFlight = Depends(get_single_flight),
 ) -> dict:
     """Health check endpoint."""
     return {
         "status": "healthy",
         "version": settings.app_version,
         "scenarios_loaded": len(scenario_service.scenarios),
+        "validation_cache": cache.stats(),
+        "validation_in_flight": single_flight.stats(),
     }
@@ -1,28 +1,153 @@
 """Validation API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException
+import json
+from collections.abc import AsyncIterator
 
-from app.api.dependencies import get_scenario_service, get_validation_service
-from app.models.validation import ValidationRequest, ValidationResponse
-from app.services.scenario_service import ScenarioService
-from app.services.validation_service import ValidationService
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+
+from app.api.dependencies import get_validation_runner
+from app.config import settings
+from app.models.validation import (
+    BatchItem,
+    BatchItemResult,
+    BatchValidationRequest,
+    BatchValidationResponse,
+    MultiScenarioValidationRequest,
+    ValidationRequest,
+    ValidationResponse,
+)
+from app.services.validation_runner import (
+    ScenarioNotFoundError,
+    ValidationRunner,
+    score_statistics,
+    summarise_scores,
+)
 
 router = APIRouter()
 
 
+def _scenario_not_found(scenario_id: str) -> HTTPException:
+    """Build the 404 error for an unknown scenario."""
+    return HTTPException(
+        status_code=404,
+        detail={"error": "scenario_not_found", "message": f"Scenario '{scenario_id}' not found"},
+    )
+
+
+def _check_batch_size(count: int) -> None:
+    """Reject JSON batches larger than the configured limit."""
+    if count > settings.batch_max_items:
+        raise HTTPException(
+            status_code=413,
+            detail={
+                "error": "batch_too_large",
+                "message": f"Batches are limited to {settings.batch_max_items} items; "
+                "use the NDJSON stream endpoint for larger batches",
+            },
+        )
+
+
 @router.post("/scenarios/{scenario_id}/validate", response_model=ValidationResponse)
 async def validate_solution(
     scenario_id: str,
     request: ValidationRequest,
-    scenario_service: ScenarioService = Depends(get_scenario_service),
-    validation_service: ValidationService = Depends(get_validation_service),
+    runner: ValidationRunner = Depends(get_validation_runner),
 ) -> ValidationResponse:
     """Validate a user's solution against scenario requirements."""
-    scenario = scenario_service.get_scenario(scenario_id)
-    if not scenario:
-        raise HTTPException(
-            status_code=404,
-            detail={"error": "scenario_not_found", "message": f"Scenario '{scenario_id}' not found"},
-        )
+    try:
+        return await runner.validate(scenario_id, request)
+    except ScenarioNotFoundError:
+        raise _scenario_not_found(scenario_id)
+
+
+@router.post("/scenarios/{scenario_id}/validate/batch", response_model=BatchValidationResponse)
+async def validate_batch(
+    scenario_id: str,
+    request: BatchValidationRequest,
+    runner: ValidationRunner = Depends(get_validation_runner),
+) -> BatchValidationResponse:
+    """Grade many solutions against one scenario."""
+    _check_batch_size(len(request.items))
+    try:
+        items = await runner.validate_batch(scenario_id, request.items)
+    except ScenarioNotFoundError:
+        raise _scenario_not_found(scenario_id)
+    return BatchValidationResponse(items=items, statistics=score_statistics(items))
+
+
+@router.post("/scenarios/{scenario_id}/validate/batch/stream")
+async def validate_batch_stream(
+    scenario_id: str,
+    request: Request,
+    runner: ValidationRunner = Depends(get_validation_runner),
+) -> StreamingResponse:
+    """Grade an NDJSON stream of solutions against one scenario.
+
+    The body holds one ``{"id": ..., "solution": ...}`` object per line. Results
+    are streamed back as NDJSON in completion order, one BatchItemResult per
+    line, followed by a final ``{"statistics": ...}`` line.
+    """
+    if not runner.scenario_service.get_scenario(scenario_id):
+        raise _scenario_not_found(scenario_id)
+
+    async def results() -> AsyncIterator[str]:
+        scores: list[int] = []
+        passed = errors = 0
+        items = _read_ndjson_items(request, scenario_id)
+        async for item in runner.validate_stream(scenario_id, items):
+            if item.result is None:
+                errors += 1
+            else:
+                scores.append(item.result.score)
+                passed += item.result.valid
+            yield item.model_dump_json() + "\n"
+        statistics = summarise_scores(scores, passed=passed, errors=errors)
+        yield json.dumps({"statistics": statistics.model_dump()}) + "\n"
+
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
+
+@router.post("/validate/batch", response_model=BatchValidationResponse)
+async def validate_across_scenarios(
+    request: MultiScenarioValidationRequest,
+    runner: ValidationRunner = Depends(get_validation_runner),
+) -> BatchValidationResponse:
+    """Grade one solution against several scenarios; unknown ids are reported per item."""
+    _check_batch_size(len(request.scenario_ids))
+    items = await runner.validate_across(request.solution, request.scenario_ids)
+    return BatchValidationResponse(items=items, statistics=score_statistics(items))
+
+
+async def _read_ndjson_items(
+    request: Request, scenario_id: str
+) -> AsyncIterator[BatchItem | BatchItemResult]:
+    """Parse batch items from an NDJSON request body as it arrives.
+
+    Malformed lines become failed results so one bad line doesn't abort the batch.
+    """
+    buffer = b""
+    line_number = 0
+
+    def parse(line: bytes) -> BatchItem | BatchItemResult:
+        try:
+            return BatchItem.model_validate_json(line)
+        except ValidationError as e:
+            return BatchItemResult(
+                id=f"line-{line_number}",
+                scenario_id=scenario_id,
+                error=f"Invalid batch item: {e.errors(include_url=False)[0]['msg']}",
+            )
+
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                yield parse(line)
 
-    return validation_service.validate_solution(scenario, request)
+    if buffer.strip():
+        line_number += 1
+        yield parse(buffer)
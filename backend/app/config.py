@@ -1,7 +1,7 @@
 """Application configuration."""
 
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic_settings import BaseSettings
 
@@ -23,6 +23,18 @@ class Settings(BaseSettings):
     # Paths
     scenarios_path: str = str(Path(__file__).parent.parent / "scenarios")
 
+    # Validation execution
+    validation_backend: Literal["inline", "thread", "process"] = "thread"
+    validation_workers: Optional[int] = None
+
+    # Validation result cache (0 entries disables it)
+    validation_cache_size: int = 1024
+    validation_cache_ttl_seconds: Optional[float] = 3600
+
+    # Batch grading
+    batch_max_items: int = 1000
+    batch_concurrency: int = 16
+
     # Future: LLM Integration
     llm_provider: Optional[str] = None
     openai_api_key: Optional[str] = None
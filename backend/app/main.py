@@ -5,6 +5,7 @@ import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.dependencies import get_validation_executor
 from app.api.routes import router
 from app.config import settings
 
@@ -44,9 +45,11 @@ async def startup_event():
     """Application startup handler."""
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
     logger.info(f"CORS origins: {settings.cors_origins_list}")
+    logger.info(f"Validation backend: {settings.validation_backend}")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown handler."""
     logger.info("Shutting down application")
+    get_validation_executor().shutdown()
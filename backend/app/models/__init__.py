@@ -9,7 +9,13 @@ from app.models.scenario import (
     ValidationRule,
 )
 from app.models.validation import (
+    BatchItem,
+    BatchItemResult,
+    BatchValidationRequest,
+    BatchValidationResponse,
+    MultiScenarioValidationRequest,
     RequirementResult,
+    ScoreStatistics,
     SyntaxError,
     ValidationRequest,
     ValidationResponse,
@@ -17,11 +23,17 @@ from app.models.validation import (
 )
 
 __all__ = [
+    "BatchItem",
+    "BatchItemResult",
+    "BatchValidationRequest",
+    "BatchValidationResponse",
     "Difficulty",
+    "MultiScenarioValidationRequest",
     "Requirement",
     "RequirementResult",
     "ScenarioFile",
     "ScenarioSummary",
+    "ScoreStatistics",
     "SyntaxError",
     "Topic",
     "ValidationRequest",
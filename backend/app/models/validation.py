@@ -1,5 +1,7 @@
 """Validation data models."""
 
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -44,3 +46,52 @@ class ValidationResponse(BaseModel):
     feedback: str
     syntax_errors: list[SyntaxError]
     warnings: list[Warning]
+
+
+class BatchItem(BaseModel):
+    """One submission in a batch grading request."""
+
+    id: str = Field(..., description="Caller-chosen identifier, e.g. a student id")
+    solution: str = Field(..., description="User's YAML/JSON solution")
+
+
+class BatchValidationRequest(BaseModel):
+    """Request body for grading many solutions against one scenario."""
+
+    items: list[BatchItem] = Field(..., min_length=1)
+
+
+class MultiScenarioValidationRequest(BaseModel):
+    """Request body for grading one solution against many scenarios."""
+
+    solution: str = Field(..., description="User's YAML/JSON solution")
+    scenario_ids: list[str] = Field(..., min_length=1)
+
+
+class BatchItemResult(BaseModel):
+    """Outcome of grading one batch item."""
+
+    id: str
+    scenario_id: str
+    result: Optional[ValidationResponse] = None
+    error: Optional[str] = None
+
+
+class ScoreStatistics(BaseModel):
+    """Aggregate scores over the successfully graded items of a batch."""
+
+    count: int = Field(..., description="Items graded")
+    errors: int = Field(..., description="Items that could not be graded")
+    passed: int = Field(..., description="Items meeting every requirement")
+    mean: float
+    median: float
+    min: int
+    max: int
+    stdev: float
+
+
+class BatchValidationResponse(BaseModel):
+    """Per-item results and score statistics for a batch."""
+
+    items: list[BatchItemResult]
+    statistics: ScoreStatistics
@@ -2,15 +2,28 @@
 
 from typing import Callable, Optional
 
+from app.services.spec_index import SpecIndex
+
 # Registry of custom validators
 _validators: dict[str, Callable] = {}
 
+# Names of validators that take a SpecIndex instead of the raw spec
+_index_validators: set[str] = set()
+
 
-def register_validator(name: str):
-    """Decorator to register a custom validator."""
+def register_validator(name: str, *, uses_index: bool = False):
+    """Decorator to register a custom validator.
+
+    Validators receive the parsed spec as their first argument, or the shared
+    SpecIndex for the validation when registered with ``uses_index=True``.
+    """
 
     def decorator(func: Callable):
         _validators[name] = func
+        if uses_index:
+            _index_validators.add(name)
+        else:
+            _index_validators.discard(name)
         return func
 
     return decorator
@@ -21,79 +34,66 @@ def get_validator(name: str) -> Optional[Callable]:
     return _validators.get(name)
 
 
+def validator_uses_index(name: str) -> bool:
+    """Whether a registered validator takes a SpecIndex instead of the spec."""
+    return name in _index_validators
+
+
 # --- Built-in Custom Validators ---
 
+# Operation methods checked by has_path_parameter, in reporting order
+_PARAMETER_METHODS = ["get", "post", "put", "delete", "patch", "options", "head"]
+
+# Operation methods checked by security_scheme_applied
+_SECURITY_METHODS = {"get", "post", "put", "delete", "patch"}
+
 
-@register_validator("has_path_parameter")
-def has_path_parameter(spec: dict, path: str, param_name: str) -> tuple[bool, str]:
+@register_validator("has_path_parameter", uses_index=True)
+def has_path_parameter(index: SpecIndex, path: str, param_name: str) -> tuple[bool, str]:
     """Check if a path has a specific path parameter defined."""
-    paths = spec.get("paths", {})
-    path_item = paths.get(path, {})
+    declared_in = index.parameters.get("path", {}).get((path, param_name), [])
 
     # Check path-level parameters
-    for param in path_item.get("parameters", []):
-        if param.get("name") == param_name and param.get("in") == "path":
-            return True, f"Path parameter '{param_name}' found"
+    if None in declared_in:
+        return True, f"Path parameter '{param_name}' found"
 
     # Check operation-level parameters
-    for method in ["get", "post", "put", "delete", "patch", "options", "head"]:
-        operation = path_item.get(method, {})
-        for param in operation.get("parameters", []):
-            if param.get("name") == param_name and param.get("in") == "path":
-                return True, f"Path parameter '{param_name}' found in {method.upper()}"
+    for method in _PARAMETER_METHODS:
+        if method in declared_in:
+            return True, f"Path parameter '{param_name}' found in {method.upper()}"
 
     return False, f"Path parameter '{param_name}' not found in '{path}'"
 
 
-@register_validator("uses_component_ref")
+@register_validator("uses_component_ref", uses_index=True)
 def uses_component_ref(
-    spec: dict, component_type: str, component_name: str
+    index: SpecIndex, component_type: str, component_name: str
 ) -> tuple[bool, str]:
     """Check if the spec uses a $ref to a specific component."""
     ref_path = f"#/components/{component_type}/{component_name}"
 
-    def find_ref(obj, path=""):
-        if isinstance(obj, dict):
-            if obj.get("$ref") == ref_path:
-                return True
-            for key, value in obj.items():
-                if find_ref(value, f"{path}.{key}"):
-                    return True
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                if find_ref(item, f"{path}[{i}]"):
-                    return True
-        return False
-
-    if find_ref(spec):
+    if ref_path in index.refs:
         return True, f"Reference to {ref_path} found"
     return False, f"No reference to {ref_path} found"
 
 
-@register_validator("security_scheme_applied")
+@register_validator("security_scheme_applied", uses_index=True)
 def security_scheme_applied(
-    spec: dict, scheme_name: str, scope: str = "global"
+    index: SpecIndex, scheme_name: str, scope: str = "global"
 ) -> tuple[bool, str]:
     """Check if a security scheme is applied."""
     if scope == "global":
-        security = spec.get("security", [])
-        for req in security:
-            if scheme_name in req:
-                return True, f"Security scheme '{scheme_name}' applied globally"
+        if scheme_name in index.global_security:
+            return True, f"Security scheme '{scheme_name}' applied globally"
         return False, f"Security scheme '{scheme_name}' not found in global security"
 
     # Check specific operation
-    for path, path_item in spec.get("paths", {}).items():
-        for method, operation in path_item.items():
-            if method in ["get", "post", "put", "delete", "patch"]:
-                if isinstance(operation, dict):
-                    security = operation.get("security", [])
-                    for req in security:
-                        if scheme_name in req:
-                            return (
-                                True,
-                                f"Security scheme '{scheme_name}' applied to {method.upper()} {path}",
-                            )
+    for path, method in index.operation_security.get(scheme_name, []):
+        if method in _SECURITY_METHODS:
+            return (
+                True,
+                f"Security scheme '{scheme_name}' applied to {method.upper()} {path}",
+            )
 
     return False, f"Security scheme '{scheme_name}' not applied to any operation"
 
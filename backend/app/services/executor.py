@@ -0,0 +1,109 @@
+"""Execution backends for running validation off the event loop."""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from functools import partial
+from typing import Optional
+
+from app.models.scenario import ScenarioFile
+from app.models.validation import ValidationRequest, ValidationResponse
+from app.services.rule_plans import ScenarioPlan
+from app.services.scenario_service import ScenarioService
+from app.services.validation_service import ValidationService
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionBackend(str, Enum):
+    """Where validation work runs."""
+
+    INLINE = "inline"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+# Per-process services for process pool workers, set by _init_worker
+_worker_scenario_service: Optional[ScenarioService] = None
+_worker_validation_service: Optional[ValidationService] = None
+
+
+def _init_worker(scenarios_path: str) -> None:
+    """Load scenarios and compile rule plans once per worker process."""
+    global _worker_scenario_service, _worker_validation_service
+    logging.getLogger("app.services.scenario_service").setLevel(logging.WARNING)
+    _worker_scenario_service = ScenarioService(scenarios_path)
+    _worker_validation_service = ValidationService()
+
+
+def _validate_in_worker(scenario_id: str, request: ValidationRequest) -> ValidationResponse:
+    """Validate a solution inside a worker process."""
+    scenario = _worker_scenario_service.get_scenario(scenario_id)
+    if scenario is None:
+        raise LookupError(f"Scenario '{scenario_id}' is not loaded in worker process")
+    plan = _worker_scenario_service.get_plan(scenario_id)
+    return _worker_validation_service.validate_solution(scenario, request, plan)
+
+
+class ValidationExecutor:
+    """Runs ValidationService work inline, on a thread pool or on a process pool."""
+
+    def __init__(
+        self,
+        validation_service: ValidationService,
+        backend: ExecutionBackend,
+        workers: Optional[int],
+        scenarios_path: str,
+    ):
+        self.validation_service = validation_service
+        self.backend = ExecutionBackend(backend)
+        self.workers = workers
+        self.scenarios_path = scenarios_path
+        self._pool: Optional[Executor] = None
+
+    @property
+    def pool(self) -> Executor:
+        """The underlying executor, created on first use."""
+        if self._pool is None:
+            if self.backend == ExecutionBackend.PROCESS:
+                # spawn avoids forking a process that already runs event loop threads
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.scenarios_path,),
+                )
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="validation"
+                )
+            logger.info(f"Started {self.backend.value} validation pool")
+        return self._pool
+
+    async def validate(
+        self,
+        scenario: ScenarioFile,
+        request: ValidationRequest,
+        plan: Optional[ScenarioPlan] = None,
+    ) -> ValidationResponse:
+        """Validate a solution using the configured backend."""
+        if self.backend == ExecutionBackend.INLINE:
+            return self.validation_service.validate_solution(scenario, request, plan)
+
+        loop = asyncio.get_running_loop()
+        if self.backend == ExecutionBackend.PROCESS:
+            return await loop.run_in_executor(
+                self.pool, _validate_in_worker, scenario.id, request
+            )
+        return await loop.run_in_executor(
+            self.pool,
+            partial(self.validation_service.validate_solution, scenario, request, plan),
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
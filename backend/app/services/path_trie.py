@@ -0,0 +1,87 @@
+"""Shared-prefix evaluation of simple JSONPath rules."""
+
+from typing import Any, Optional
+
+from jsonpath_ng import JSONPath
+from jsonpath_ng.jsonpath import Child, Fields, Index, Root
+
+# Keys leading from the document root to a value
+Keys = tuple[str | int, ...]
+
+# Marker for paths that have no match in the document
+MISSING = object()
+
+
+def simple_path_keys(expr: JSONPath) -> Optional[Keys]:
+    """Return the key chain of a parsed JSONPath made only of single names and indices.
+
+    ``$.paths['/users'].get.parameters[0]`` becomes ``("paths", "/users", "get",
+    "parameters", 0)``. Paths using wildcards, unions, slices, filters or
+    descendant search return None and must be evaluated by jsonpath_ng.
+    """
+    keys: list[str | int] = []
+    node = expr
+    while type(node) is Child:
+        right = node.right
+        if type(right) is Fields and len(right.fields) == 1 and right.fields[0] != "*":
+            keys.append(right.fields[0])
+        elif type(right) is Index and len(right.indices) == 1 and right.indices[0] >= 0:
+            keys.append(right.indices[0])
+        else:
+            return None
+        node = node.left
+    if type(node) is not Root:
+        return None
+    return tuple(reversed(keys))
+
+
+class _Node:
+    """A trie node: child keys and whether a rule's path ends here."""
+
+    __slots__ = ("children", "terminal")
+
+    def __init__(self):
+        self.children: dict[str | int, _Node] = {}
+        self.terminal = False
+
+
+class PathTrie:
+    """Merges the simple paths of a scenario's rules into one trie.
+
+    ``resolve`` walks the parsed document once, following each shared prefix a
+    single time, and returns the value at every path that exists. Lookups match
+    jsonpath_ng: names only match mapping keys and indices only match list items.
+    """
+
+    def __init__(self, paths: list[Keys] = ()):
+        self._root = _Node()
+        self.size = 0
+        for keys in paths:
+            self.add(keys)
+
+    def add(self, keys: Keys) -> None:
+        """Register a path."""
+        node = self._root
+        for key in keys:
+            node = node.children.setdefault(key, _Node())
+        if not node.terminal:
+            node.terminal = True
+            self.size += 1
+
+    def resolve(self, document: Any) -> dict[Keys, Any]:
+        """Return the value of every registered path that exists in the document."""
+        found: dict[Keys, Any] = {}
+        if self.size:
+            self._descend(self._root, document, (), found)
+        return found
+
+    def _descend(self, node: _Node, value: Any, keys: Keys, found: dict[Keys, Any]) -> None:
+        if node.terminal:
+            found[keys] = value
+        for key, child in node.children.items():
+            if isinstance(key, int):
+                if not isinstance(value, list) or key >= len(value):
+                    continue
+            elif not isinstance(value, dict) or key not in value:
+                continue
+            self._descend(child, value[key], keys + (key,), found)
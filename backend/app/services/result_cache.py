@@ -0,0 +1,128 @@
+"""Content-addressed cache of validation results."""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from app.models.validation import ValidationResponse
+
+# (scenario id, scenario content hash, solution hash)
+CacheKey = tuple[str, str, str]
+
+
+def hash_content(content: str | bytes) -> str:
+    """Return the SHA-256 hex digest of text or bytes."""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+class ValidationResultCache:
+    """Bounded LRU cache of ValidationResponses with optional TTL expiry.
+
+    Keys include the scenario content hash, so results computed against an
+    older version of a scenario file are never served. When a new content
+    hash is seen for a scenario, its old entries are dropped eagerly.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[CacheKey, tuple[float, ValidationResponse]] = OrderedDict()
+        self._scenario_hashes: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def make_key(scenario_id: str, scenario_hash: str, solution: str) -> CacheKey:
+        """Build the cache key for a solution submitted to a scenario."""
+        return (scenario_id, scenario_hash, hash_content(solution))
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.max_entries > 0
+
+    def get(self, key: CacheKey) -> Optional[ValidationResponse]:
+        """Return a cached response, or None on a miss."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            self._check_scenario_hash(key)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            stored_at, response = entry
+            if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+
+    def put(self, key: CacheKey, response: ValidationResponse) -> None:
+        """Store a response, evicting the least recently used entries if full."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._check_scenario_hash(key)
+            self._entries[key] = (time.monotonic(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate_scenario(self, scenario_id: str) -> int:
+        """Drop every cached result for a scenario and return how many were removed."""
+        with self._lock:
+            return self._drop_scenario(scenario_id)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self._scenario_hashes.clear()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current occupancy."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def _check_scenario_hash(self, key: CacheKey) -> None:
+        """Drop a scenario's entries when its content hash changes. Lock must be held."""
+        scenario_id, scenario_hash, _ = key
+        known = self._scenario_hashes.get(scenario_id)
+        if known != scenario_hash:
+            if known is not None:
+                self._drop_scenario(scenario_id)
+            self._scenario_hashes[scenario_id] = scenario_hash
+
+    def _drop_scenario(self, scenario_id: str) -> int:
+        """Remove a scenario's entries. Lock must be held."""
+        stale = [key for key in self._entries if key[0] == scenario_id]
+        for key in stale:
+            del self._entries[key]
+        self._scenario_hashes.pop(scenario_id, None)
+        return len(stale)
@@ -0,0 +1,147 @@
+"""Compilation of scenario validation rules into executable plans."""
+
+import inspect
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from jsonpath_ng import JSONPath
+from jsonpath_ng.exceptions import JSONPathError
+from jsonpath_ng.ext import parse as jsonpath_parse
+from jsonschema.exceptions import SchemaError
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+
+from app.models.scenario import ScenarioFile, ValidationRule
+from app.services.custom_validators import get_validator, validator_uses_index
+from app.services.path_trie import Keys, PathTrie, simple_path_keys
+
+# Config keys each rule type needs besides "path"
+_REQUIRED_CONFIG = {
+    "json_path_exists": (),
+    "json_path_equals": ("value",),
+    "json_path_contains": ("values",),
+    "json_path_matches": ("pattern",),
+    "schema_validates": ("schema",),
+}
+
+RULE_TYPES = frozenset(_REQUIRED_CONFIG) | {"custom"}
+
+
+class RuleCompilationError(ValueError):
+    """Raised when a validation rule cannot be compiled."""
+
+
+@dataclass(frozen=True)
+class RulePlan:
+    """A validation rule prepared for repeated evaluation.
+
+    Simple paths are stored as ``keys`` and resolved through the scenario's
+    PathTrie; only other paths keep a jsonpath_ng ``expr``.
+    """
+
+    type: str
+    config: dict[str, Any]
+    path: Optional[str] = None
+    keys: Optional[Keys] = None
+    expr: Optional[JSONPath] = None
+    pattern: Optional[re.Pattern] = None
+    schema_validator: Optional[Validator] = None
+    validator: Optional[Callable] = None
+    validator_name: Optional[str] = None
+    validator_args: dict[str, Any] = field(default_factory=dict)
+    validator_uses_index: bool = False
+
+
+@dataclass(frozen=True)
+class ScenarioPlan:
+    """All compiled rules of a scenario, in requirement order."""
+
+    rules: tuple[RulePlan, ...]
+    path_trie: PathTrie = field(default_factory=PathTrie)
+
+
+def compile_rule(rule: ValidationRule) -> RulePlan:
+    """Compile a single validation rule, raising RuleCompilationError if invalid."""
+    if rule.type not in RULE_TYPES:
+        raise RuleCompilationError(f"Unknown rule type: {rule.type}")
+
+    config = rule.config
+    if rule.type == "custom":
+        return _compile_custom(rule)
+
+    missing = [key for key in ("path", *_REQUIRED_CONFIG[rule.type]) if key not in config]
+    if missing:
+        raise RuleCompilationError(f"Rule {rule.type} is missing config: {', '.join(missing)}")
+
+    path = config["path"]
+    try:
+        expr = jsonpath_parse(path)
+    except JSONPathError as e:
+        raise RuleCompilationError(f"Invalid JSONPath '{path}': {e}") from e
+    keys = simple_path_keys(expr)
+
+    pattern = None
+    if rule.type == "json_path_matches":
+        try:
+            pattern = re.compile(config["pattern"])
+        except re.error as e:
+            raise RuleCompilationError(f"Invalid pattern '{config['pattern']}': {e}") from e
+
+    schema_validator = None
+    if rule.type == "schema_validates":
+        schema = config["schema"]
+        validator_cls = validator_for(schema)
+        try:
+            validator_cls.check_schema(schema)
+        except SchemaError as e:
+            raise RuleCompilationError(f"Invalid JSON schema: {e.message}") from e
+        schema_validator = validator_cls(schema)
+
+    return RulePlan(
+        type=rule.type,
+        config=config,
+        path=path,
+        keys=keys,
+        expr=expr if keys is None else None,
+        pattern=pattern,
+        schema_validator=schema_validator,
+    )
+
+
+def _compile_custom(rule: ValidationRule) -> RulePlan:
+    """Resolve a custom validator and check its arguments against its signature."""
+    name = rule.config.get("validator")
+    if not name:
+        raise RuleCompilationError("Rule custom is missing config: validator")
+
+    validator = get_validator(name)
+    if not validator:
+        raise RuleCompilationError(f"Unknown custom validator: {name}")
+
+    args = rule.config.get("args", {})
+    try:
+        inspect.signature(validator).bind(None, **args)
+    except TypeError as e:
+        raise RuleCompilationError(f"Invalid arguments for validator {name}: {e}") from e
+
+    return RulePlan(
+        type=rule.type,
+        config=rule.config,
+        validator=validator,
+        validator_name=name,
+        validator_args=args,
+        validator_uses_index=validator_uses_index(name),
+    )
+
+
+def compile_scenario(scenario: ScenarioFile) -> ScenarioPlan:
+    """Compile every validation rule of a scenario."""
+    rules = []
+    for index, rule in enumerate(scenario.validation_rules):
+        try:
+            rules.append(compile_rule(rule))
+        except RuleCompilationError as e:
+            raise RuleCompilationError(f"Rule {index + 1} of '{scenario.id}': {e}") from e
+    path_trie = PathTrie([rule.keys for rule in rules if rule.keys is not None])
+    return ScenarioPlan(rules=tuple(rules), path_trie=path_trie)
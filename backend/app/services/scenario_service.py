@@ -7,6 +7,8 @@ from typing import Optional
 import yaml
 
 from app.models.scenario import Difficulty, ScenarioFile, ScenarioSummary, Topic
+from app.services.result_cache import hash_content
+from app.services.rule_plans import ScenarioPlan, compile_scenario
 
 logger = logging.getLogger(__name__)
 
@@ -17,20 +19,25 @@ class ScenarioService:
     def __init__(self, scenarios_path: str):
         self.scenarios_path = Path(scenarios_path)
         self.scenarios: dict[str, ScenarioFile] = {}
+        self.plans: dict[str, ScenarioPlan] = {}
+        self.content_hashes: dict[str, str] = {}
         self._load_scenarios()
 
     def _load_scenarios(self) -> None:
-        """Load all scenario files from disk."""
+        """Load all scenario files from disk and compile their validation rules."""
         if not self.scenarios_path.exists():
             logger.warning(f"Scenarios directory not found: {self.scenarios_path}")
             return
 
         for yaml_file in self.scenarios_path.glob("*.yaml"):
             try:
-                with open(yaml_file, encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
+                content = yaml_file.read_bytes()
+                data = yaml.safe_load(content)
                 scenario = ScenarioFile(**data)
+                plan = compile_scenario(scenario)
                 self.scenarios[scenario.id] = scenario
+                self.plans[scenario.id] = plan
+                self.content_hashes[scenario.id] = hash_content(content)
                 logger.info(f"Loaded scenario: {scenario.id}")
             except Exception as e:
                 logger.error(f"Failed to load scenario {yaml_file}: {e}")
@@ -76,6 +83,14 @@ class ScenarioService:
         """Get a scenario by ID."""
         return self.scenarios.get(scenario_id)
 
+    def get_plan(self, scenario_id: str) -> Optional[ScenarioPlan]:
+        """Get the compiled validation rules for a scenario."""
+        return self.plans.get(scenario_id)
+
+    def get_content_hash(self, scenario_id: str) -> Optional[str]:
+        """Get the SHA-256 of the file a scenario was loaded from."""
+        return self.content_hashes.get(scenario_id)
+
     def count_scenarios_by_topic(self, topic: Topic) -> int:
         """Count scenarios that include a specific topic."""
         return sum(1 for s in self.scenarios.values() if topic in s.topics)
@@ -0,0 +1,52 @@
+"""Coalescing of identical concurrent computations."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Runs at most one computation per key at a time and shares its result.
+
+    The first caller for a key starts the computation as its own task; callers
+    arriving while it is in flight await the same task. The task is shielded
+    from caller cancellation, so a client disconnecting does not abort work
+    other callers are waiting on.
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Return the result of ``func()``, sharing it with concurrent callers of ``key``."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            self.started += 1
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the number of in-flight, started and coalesced computations."""
+        return {
+            "in_flight": len(self._inflight),
+            "started": self.started,
+            "coalesced": self.coalesced,
+        }
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished task and log failures nobody was left to receive."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Shared computation for {key!r} failed: {task.exception()}")
@@ -0,0 +1,117 @@
+"""Lazily built lookup tables over a parsed OpenAPI document."""
+
+from functools import cached_property
+from typing import Any, Optional
+
+HTTP_METHODS = frozenset({"get", "put", "post", "delete", "options", "head", "patch", "trace"})
+
+# A location inside the document, as the sequence of keys/indices leading to it
+Location = tuple[str | int, ...]
+
+
+class SpecIndex:
+    """Indexes a spec for custom validators.
+
+    One index is built per validation and shared by every rule. Each table is
+    computed on first access: ``refs`` walks the whole document once, and the
+    operation, parameter and security tables come from one pass over ``paths``.
+    Malformed parts of the document (non-mapping path items, operations or
+    parameters) are skipped rather than raising.
+    """
+
+    def __init__(self, spec: dict):
+        self.spec = spec
+
+    @cached_property
+    def refs(self) -> dict[str, list[Location]]:
+        """Every ``$ref`` target mapped to the locations that reference it."""
+        refs: dict[str, list[Location]] = {}
+        parts: list[str | int] = []
+
+        def walk(node: Any) -> None:
+            if isinstance(node, dict):
+                target = node.get("$ref")
+                if isinstance(target, str):
+                    refs.setdefault(target, []).append(tuple(parts))
+                for key, value in node.items():
+                    if isinstance(value, (dict, list)):
+                        parts.append(key)
+                        walk(value)
+                        parts.pop()
+            elif isinstance(node, list):
+                for i, item in enumerate(node):
+                    if isinstance(item, (dict, list)):
+                        parts.append(i)
+                        walk(item)
+                        parts.pop()
+
+        walk(self.spec)
+        return refs
+
+    @cached_property
+    def global_security(self) -> frozenset[str]:
+        """Names of the security schemes required at the document root."""
+        return frozenset(self._scheme_names(self.spec.get("security")))
+
+    @property
+    def operations(self) -> dict[tuple[str, str], dict]:
+        """Operations keyed by (path, method), in document order."""
+        return self._paths_index[0]
+
+    @property
+    def parameters(self) -> dict[str, dict[tuple[str, str], list[Optional[str]]]]:
+        """Parameters by location (``in``), then by (path, name).
+
+        Each entry lists where the parameter is declared, in document order:
+        ``None`` for the path item, otherwise the operation's method.
+        """
+        return self._paths_index[1]
+
+    @property
+    def operation_security(self) -> dict[str, list[tuple[str, str]]]:
+        """Security scheme names mapped to the (path, method) operations requiring them."""
+        return self._paths_index[2]
+
+    def operation(self, path: str, method: str) -> Optional[dict]:
+        """Return the operation for a path and method, if defined."""
+        return self.operations.get((path, method))
+
+    @cached_property
+    def _paths_index(self) -> tuple[dict, dict, dict]:
+        """Build the operation, parameter and security tables in one pass over paths."""
+        operations: dict[tuple[str, str], dict] = {}
+        parameters: dict[str, dict[tuple[str, str], list[Optional[str]]]] = {}
+        security: dict[str, list[tuple[str, str]]] = {}
+
+        def add_parameters(path: str, method: Optional[str], params: Any) -> None:
+            if not isinstance(params, list):
+                return
+            for param in params:
+                if isinstance(param, dict) and "name" in param and "in" in param:
+                    by_name = parameters.setdefault(param["in"], {})
+                    by_name.setdefault((path, param["name"]), []).append(method)
+
+        paths = self.spec.get("paths")
+        if not isinstance(paths, dict):
+            return operations, parameters, security
+
+        for path, path_item in paths.items():
+            if not isinstance(path_item, dict):
+                continue
+            add_parameters(path, None, path_item.get("parameters"))
+            for method, operation in path_item.items():
+                if method not in HTTP_METHODS or not isinstance(operation, dict):
+                    continue
+                operations[(path, method)] = operation
+                add_parameters(path, method, operation.get("parameters"))
+                for name in self._scheme_names(operation.get("security")):
+                    security.setdefault(name, []).append((path, method))
+
+        return operations, parameters, security
+
+    @staticmethod
+    def _scheme_names(requirements: Any) -> list[str]:
+        """Scheme names used by a list of security requirement objects."""
+        if not isinstance(requirements, list):
+            return []
+        return [name for req in requirements if isinstance(req, dict) for name in req]
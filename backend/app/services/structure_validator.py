@@ -0,0 +1,86 @@
+"""Reusable OpenAPI structural validation."""
+
+from collections.abc import Iterator
+from typing import Optional
+
+from jsonschema.exceptions import ValidationError
+from jsonschema_path import SchemaPath
+from openapi_spec_validator import (
+    OpenAPIV2SpecValidator,
+    OpenAPIV30SpecValidator,
+    OpenAPIV31SpecValidator,
+    OpenAPIV32SpecValidator,
+)
+from openapi_spec_validator.settings import OpenAPISpecValidatorSettings
+from openapi_spec_validator.validation.registries import KeywordValidatorRegistry
+from openapi_spec_validator.validation.validators import SpecValidator
+
+from app.models.validation import Warning
+from app.utils.json_path import format_json_path
+
+# (version keyword, major.minor) -> openapi-spec-validator class for that version
+_SPEC_VALIDATORS: dict[tuple[str, str], type[SpecValidator]] = {
+    ("swagger", "2.0"): OpenAPIV2SpecValidator,
+    ("openapi", "3.0"): OpenAPIV30SpecValidator,
+    ("openapi", "3.1"): OpenAPIV31SpecValidator,
+    ("openapi", "3.2"): OpenAPIV32SpecValidator,
+}
+
+
+class StructureValidator:
+    """Validates documents against the OpenAPI schema for their declared version.
+
+    ``openapi_spec_validator.validate`` detects the version, reads its settings
+    from the environment, builds a resolver and a validator object on every call,
+    and the validator's error iterator is memoised in an unbounded module-level
+    cache, so each call also leaks the document. This class does that setup once
+    per version and reuses it, and it reports every error instead of the first.
+    """
+
+    def __init__(self):
+        self._resolved_cache_maxsize = OpenAPISpecValidatorSettings().resolved_cache_maxsize
+
+    def validator_for(self, spec: dict) -> Optional[type[SpecValidator]]:
+        """Return the spec validator class for the document's declared version."""
+        for keyword in ("openapi", "swagger"):
+            version = spec.get(keyword)
+            if version is not None:
+                major_minor = ".".join(str(version).split(".")[:2])
+                return _SPEC_VALIDATORS.get((keyword, major_minor))
+        return None
+
+    def iter_errors(self, spec: dict) -> Iterator[ValidationError]:
+        """Yield every structural error in the document.
+
+        Semantic checks (path parameters, operationIds, defaults, ...) only run
+        once the document matches the schema, as they assume a valid shape.
+        """
+        validator_cls = self.validator_for(spec)
+        if validator_cls is None:
+            raise ValueError("Unsupported or missing OpenAPI version")
+
+        has_schema_errors = False
+        for error in validator_cls.schema_validator.iter_errors(spec):
+            has_schema_errors = True
+            yield error
+        if has_schema_errors:
+            return
+
+        # Keyword validators keep per-run state, so the registry is per call
+        registry = KeywordValidatorRegistry(validator_cls.keyword_validators)
+        schema_path = SchemaPath.from_dict(
+            spec,
+            handlers=validator_cls.resolver_handlers,
+            resolved_cache_maxsize=self._resolved_cache_maxsize,
+        )
+        yield from registry["__root__"](schema_path)
+
+    def validate(self, spec: dict) -> list[Warning]:
+        """Return all structural errors as warnings with JSONPath locations."""
+        try:
+            return [
+                Warning(path=format_json_path(error.absolute_path), message=error.message)
+                for error in self.iter_errors(spec)
+            ]
+        except Exception as e:
+            return [Warning(path="", message=f"OpenAPI validation error: {e}")]
@@ -0,0 +1,159 @@
+"""Scenario-level validation with caching, coalescing and batch grading."""
+
+import asyncio
+import statistics
+from collections.abc import AsyncIterable, AsyncIterator
+
+from app.models.validation import (
+    BatchItem,
+    BatchItemResult,
+    ScoreStatistics,
+    ValidationRequest,
+    ValidationResponse,
+)
+from app.services.executor import ValidationExecutor
+from app.services.result_cache import ValidationResultCache
+from app.services.scenario_service import ScenarioService
+from app.services.single_flight import SingleFlight
+
+
+class ScenarioNotFoundError(LookupError):
+    """Raised when validating against a scenario id that is not loaded."""
+
+    def __init__(self, scenario_id: str):
+        super().__init__(f"Scenario '{scenario_id}' not found")
+        self.scenario_id = scenario_id
+
+
+class ValidationRunner:
+    """Validates solutions against scenarios by id.
+
+    Results are served from the result cache when possible, identical
+    concurrent submissions share one run, and the work itself goes to the
+    configured executor. Batches reuse the compiled rule plans and run up to
+    ``concurrency`` items at once; with the process backend they spread over
+    all worker processes.
+    """
+
+    def __init__(
+        self,
+        scenario_service: ScenarioService,
+        executor: ValidationExecutor,
+        cache: ValidationResultCache,
+        single_flight: SingleFlight,
+        concurrency: int = 16,
+    ):
+        self.scenario_service = scenario_service
+        self.executor = executor
+        self.cache = cache
+        self.single_flight = single_flight
+        self.concurrency = concurrency
+
+    async def validate(self, scenario_id: str, request: ValidationRequest) -> ValidationResponse:
+        """Validate one solution, raising ScenarioNotFoundError for unknown scenarios."""
+        scenario = self.scenario_service.get_scenario(scenario_id)
+        if not scenario:
+            raise ScenarioNotFoundError(scenario_id)
+
+        key = self.cache.make_key(
+            scenario_id, self.scenario_service.get_content_hash(scenario_id), request.solution
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        plan = self.scenario_service.get_plan(scenario_id)
+
+        async def compute() -> ValidationResponse:
+            response = await self.executor.validate(scenario, request, plan)
+            self.cache.put(key, response)
+            return response
+
+        # Identical submissions arriving together share one validation run
+        return await self.single_flight.run(key, compute)
+
+    async def validate_batch(self, scenario_id: str, items: list[BatchItem]) -> list[BatchItemResult]:
+        """Grade many solutions against one scenario, returning results in input order."""
+        if not self.scenario_service.get_scenario(scenario_id):
+            raise ScenarioNotFoundError(scenario_id)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def grade(item: BatchItem) -> BatchItemResult:
+            async with semaphore:
+                return await self._grade(scenario_id, item)
+
+        return list(await asyncio.gather(*(grade(item) for item in items)))
+
+    async def validate_across(self, solution: str, scenario_ids: list[str]) -> list[BatchItemResult]:
+        """Grade one solution against many scenarios, one result per scenario id."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def grade(scenario_id: str) -> BatchItemResult:
+            async with semaphore:
+                return await self._grade(scenario_id, BatchItem(id=scenario_id, solution=solution))
+
+        return list(await asyncio.gather(*(grade(scenario_id) for scenario_id in scenario_ids)))
+
+    async def validate_stream(
+        self,
+        scenario_id: str,
+        items: AsyncIterable[BatchItem | BatchItemResult],
+    ) -> AsyncIterator[BatchItemResult]:
+        """Grade items as they arrive and yield results in completion order.
+
+        At most ``concurrency`` items are in flight, which also throttles how fast
+        ``items`` is consumed. Results already in ``items`` (such as input lines
+        that failed to parse) are passed straight through.
+        """
+        pending: set[asyncio.Task] = set()
+        try:
+            async for item in items:
+                if isinstance(item, BatchItemResult):
+                    yield item
+                    continue
+                if len(pending) >= self.concurrency:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+                pending.add(asyncio.create_task(self._grade(scenario_id, item)))
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _grade(self, scenario_id: str, item: BatchItem) -> BatchItemResult:
+        """Validate one batch item, capturing failures in the result."""
+        try:
+            response = await self.validate(scenario_id, ValidationRequest(solution=item.solution))
+        except Exception as e:
+            return BatchItemResult(id=item.id, scenario_id=scenario_id, error=str(e))
+        return BatchItemResult(id=item.id, scenario_id=scenario_id, result=response)
+
+
+def score_statistics(items: list[BatchItemResult]) -> ScoreStatistics:
+    """Summarise the scores of the graded items in a batch."""
+    graded = [item.result for item in items if item.result is not None]
+    return summarise_scores(
+        [result.score for result in graded],
+        passed=sum(1 for result in graded if result.valid),
+        errors=len(items) - len(graded),
+    )
+
+
+def summarise_scores(scores: list[int], passed: int, errors: int) -> ScoreStatistics:
+    """Build score statistics from raw scores, for callers that don't keep whole results."""
+    return ScoreStatistics(
+        count=len(scores),
+        errors=errors,
+        passed=passed,
+        mean=statistics.fmean(scores) if scores else 0.0,
+        median=statistics.median(scores) if scores else 0.0,
+        min=min(scores, default=0),
+        max=max(scores, default=0),
+        stdev=statistics.pstdev(scores) if scores else 0.0,
+    )
@@ -1,17 +1,15 @@
 """Validation engine for checking OpenAPI solutions."""
 
+import json
 import logging
 import re
+from functools import cached_property
 from typing import Any, Optional
 
 import yaml
-from jsonpath_ng import parse as jsonpath_parse
-from jsonschema import ValidationError as JsonSchemaValidationError
-from jsonschema import validate as json_validate
-from openapi_spec_validator import validate
-from openapi_spec_validator.validation.exceptions import OpenAPIValidationError
+from jsonschema.exceptions import best_match
 
-from app.models.scenario import Requirement, ScenarioFile, ValidationRule
+from app.models.scenario import Requirement, ScenarioFile
 from app.models.validation import (
     RequirementResult,
     SyntaxError,
@@ -19,18 +17,61 @@ from app.models.validation import (
     ValidationResponse,
     Warning,
 )
-from app.services.custom_validators import get_validator
+from app.services.path_trie import MISSING, Keys
+from app.services.rule_plans import RulePlan, ScenarioPlan, compile_scenario
+from app.services.spec_index import SpecIndex
+from app.services.structure_validator import StructureValidator
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it, pure-Python otherwise
+YAML_LOADER: type = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Content parsed as JSON: an array, or an object whose first key is quoted
+_JSON_START = re.compile(r'\s*(\[|\{\s*["}])')
+
+
+class EvaluationContext:
+    """Per-validation state shared by every rule of a scenario."""
+
+    def __init__(self, spec: dict, plan: ScenarioPlan):
+        self.spec = spec
+        # One descent over the spec answers every simple-path rule
+        self.path_values: dict[Keys, Any] = plan.path_trie.resolve(spec)
+
+    @cached_property
+    def index(self) -> SpecIndex:
+        """Lookup tables for custom validators, built on first use."""
+        return SpecIndex(self.spec)
+
+    def first_match(self, rule: RulePlan) -> Any:
+        """Return the first value matched by a rule's path, or MISSING."""
+        if rule.keys is not None:
+            return self.path_values.get(rule.keys, MISSING)
+        matches = rule.expr.find(self.spec)
+        return matches[0].value if matches else MISSING
+
 
 class ValidationService:
     """Orchestrates the validation pipeline for OpenAPI solutions."""
 
+    def __init__(self, yaml_loader: type = YAML_LOADER):
+        self.yaml_loader = yaml_loader
+        self.structure_validator = StructureValidator()
+        self._evaluators = {
+            "json_path_exists": self._eval_json_path_exists,
+            "json_path_equals": self._eval_json_path_equals,
+            "json_path_contains": self._eval_json_path_contains,
+            "json_path_matches": self._eval_json_path_matches,
+            "schema_validates": self._eval_schema_validates,
+            "custom": self._eval_custom,
+        }
+
     def validate_solution(
         self,
         scenario: ScenarioFile,
         request: ValidationRequest,
+        plan: Optional[ScenarioPlan] = None,
     ) -> ValidationResponse:
         """
         Main validation entry point.
@@ -40,7 +81,13 @@ class ValidationService:
         2. Validate OpenAPI structure
         3. Run semantic requirement checks
         4. Calculate score and generate feedback
+
+        ``plan`` should be the scenario's precompiled rule plan (see
+        ``ScenarioService.get_plan``); it is compiled on the fly when omitted.
         """
+        if plan is None:
+            plan = compile_scenario(scenario)
+
         # Step 1: Parse YAML
         parsed, syntax_errors = self._parse_yaml(request.solution)
         if syntax_errors:
@@ -58,7 +105,7 @@ class ValidationService:
         structure_warnings = self._validate_openapi_structure(parsed)
 
         # Step 3: Run semantic checks
-        results = self._check_requirements(scenario, parsed)
+        results = self._check_requirements(scenario, plan, parsed)
 
         # Step 4: Calculate results
         score = sum(r.points_earned for r in results)
@@ -76,20 +123,24 @@ class ValidationService:
         )
 
     def _parse_yaml(self, content: str) -> tuple[Optional[dict], list[SyntaxError]]:
-        """Parse YAML content, return parsed dict or syntax errors."""
-        try:
-            parsed = yaml.safe_load(content)
-            if parsed is None:
-                return None, [
-                    SyntaxError(line=1, column=1, message="Empty document")
-                ]
-            if not isinstance(parsed, dict):
+        """Parse YAML or JSON content, return parsed dict or syntax errors.
+
+        Documents that start like JSON (an array, or an object whose first key
+        is quoted) are decoded with ``json.loads``, which is much faster than
+        the YAML loader, and decode errors are reported at JSON positions.
+        Anything else, including YAML flow mappings, goes to the YAML loader.
+        """
+        if _JSON_START.match(content):
+            try:
+                parsed = json.loads(content)
+            except json.JSONDecodeError as e:
                 return None, [
-                    SyntaxError(
-                        line=1, column=1, message="OpenAPI document must be an object"
-                    )
+                    SyntaxError(line=e.lineno, column=e.colno, message=f"Invalid JSON: {e}")
                 ]
-            return parsed, []
+            return self._check_document(parsed)
+
+        try:
+            parsed = yaml.load(content, Loader=self.yaml_loader)
         except yaml.YAMLError as e:
             line = getattr(e, "problem_mark", None)
             return None, [
@@ -99,34 +150,39 @@ class ValidationService:
                     message=str(e),
                 )
             ]
+        return self._check_document(parsed)
 
-    def _validate_openapi_structure(self, spec: dict) -> list[Warning]:
-        """Validate against OpenAPI 3.0 schema and return warnings."""
-        warnings = []
-        try:
-            validate(spec)
-        except OpenAPIValidationError as e:
-            # Convert to warnings - we still allow semantic checking
-            warnings.append(
-                Warning(
-                    path=str(list(e.schema_path)) if hasattr(e, "schema_path") else "",
-                    message=str(e.message) if hasattr(e, "message") else str(e),
+    def _check_document(self, parsed: Any) -> tuple[Optional[dict], list[SyntaxError]]:
+        """Check that a parsed document is a non-empty mapping."""
+        if parsed is None:
+            return None, [
+                SyntaxError(line=1, column=1, message="Empty document")
+            ]
+        if not isinstance(parsed, dict):
+            return None, [
+                SyntaxError(
+                    line=1, column=1, message="OpenAPI document must be an object"
                 )
-            )
-        except Exception as e:
-            warnings.append(Warning(path="", message=f"OpenAPI validation error: {e}"))
-        return warnings
+            ]
+        return parsed, []
+
+    def _validate_openapi_structure(self, spec: dict) -> list[Warning]:
+        """Validate against the OpenAPI schema and return every error as a warning."""
+        # Converted to warnings - we still allow semantic checking
+        return self.structure_validator.validate(spec)
 
     def _check_requirements(
         self,
         scenario: ScenarioFile,
+        plan: ScenarioPlan,
         spec: dict,
     ) -> list[RequirementResult]:
-        """Check each requirement using its validation rules."""
+        """Check each requirement using its compiled rule plan."""
         results = []
+        context = EvaluationContext(spec, plan)
 
-        for req, rule in zip(scenario.requirements, scenario.validation_rules):
-            result = self._evaluate_rule(req, rule, spec)
+        for req, rule in zip(scenario.requirements, plan.rules):
+            result = self._evaluate_rule(req, rule, context)
             results.append(result)
 
         return results
@@ -134,31 +190,14 @@ class ValidationService:
     def _evaluate_rule(
         self,
         requirement: Requirement,
-        rule: ValidationRule,
-        spec: dict,
+        rule: RulePlan,
+        context: EvaluationContext,
     ) -> RequirementResult:
-        """Evaluate a single validation rule."""
-        evaluators = {
-            "json_path_exists": self._eval_json_path_exists,
-            "json_path_equals": self._eval_json_path_equals,
-            "json_path_contains": self._eval_json_path_contains,
-            "json_path_matches": self._eval_json_path_matches,
-            "schema_validates": self._eval_schema_validates,
-            "custom": self._eval_custom,
-        }
-
-        evaluator = evaluators.get(rule.type)
-        if not evaluator:
-            return RequirementResult(
-                requirement_id=requirement.id,
-                passed=False,
-                message=f"Unknown rule type: {rule.type}",
-                points_earned=0,
-                points_possible=requirement.points,
-            )
+        """Evaluate a single compiled validation rule."""
+        evaluator = self._evaluators[rule.type]
 
         try:
-            return evaluator(requirement, rule.config, spec)
+            return evaluator(requirement, rule, context)
         except Exception as e:
             logger.error(f"Error evaluating rule {rule.type}: {e}")
             return RequirementResult(
@@ -170,42 +209,27 @@ class ValidationService:
             )
 
     def _eval_json_path_exists(
-        self, req: Requirement, config: dict[str, Any], spec: dict
+        self, req: Requirement, rule: RulePlan, context: EvaluationContext
     ) -> RequirementResult:
         """Check if a JSON path exists in the spec."""
-        path = config["path"]
-        expr = jsonpath_parse(path)
-        matches = expr.find(spec)
-
-        passed = len(matches) > 0
+        passed = context.first_match(rule) is not MISSING
         return RequirementResult(
             requirement_id=req.id,
             passed=passed,
-            message=req.description if passed else f"Path '{path}' not found",
+            message=req.description if passed else f"Path '{rule.path}' not found",
             points_earned=req.points if passed else 0,
             points_possible=req.points,
         )
 
     def _eval_json_path_equals(
-        self, req: Requirement, config: dict[str, Any], spec: dict
+        self, req: Requirement, rule: RulePlan, context: EvaluationContext
     ) -> RequirementResult:
         """Check if a JSON path equals a specific value."""
-        path = config["path"]
-        expected = config["value"]
+        expected = rule.config["value"]
+        actual = context.first_match(rule)
+        if actual is MISSING:
+            return self._path_not_found(req, rule)
 
-        expr = jsonpath_parse(path)
-        matches = expr.find(spec)
-
-        if not matches:
-            return RequirementResult(
-                requirement_id=req.id,
-                passed=False,
-                message=f"Path '{path}' not found",
-                points_earned=0,
-                points_possible=req.points,
-            )
-
-        actual = matches[0].value
         passed = actual == expected
 
         return RequirementResult(
@@ -217,25 +241,14 @@ class ValidationService:
         )
 
     def _eval_json_path_contains(
-        self, req: Requirement, config: dict[str, Any], spec: dict
+        self, req: Requirement, rule: RulePlan, context: EvaluationContext
     ) -> RequirementResult:
         """Check if a JSON path contains specific values."""
-        path = config["path"]
-        required_values = config["values"]
+        required_values = rule.config["values"]
+        actual = context.first_match(rule)
+        if actual is MISSING:
+            return self._path_not_found(req, rule)
 
-        expr = jsonpath_parse(path)
-        matches = expr.find(spec)
-
-        if not matches:
-            return RequirementResult(
-                requirement_id=req.id,
-                passed=False,
-                message=f"Path '{path}' not found",
-                points_earned=0,
-                points_possible=req.points,
-            )
-
-        actual = matches[0].value
         if isinstance(actual, dict):
             actual_set = set(actual.keys())
         elif isinstance(actual, list):
@@ -255,26 +268,15 @@ class ValidationService:
         )
 
     def _eval_json_path_matches(
-        self, req: Requirement, config: dict[str, Any], spec: dict
+        self, req: Requirement, rule: RulePlan, context: EvaluationContext
     ) -> RequirementResult:
         """Check if a JSON path value matches a regex pattern."""
-        path = config["path"]
-        pattern = config["pattern"]
+        value = context.first_match(rule)
+        if value is MISSING:
+            return self._path_not_found(req, rule)
 
-        expr = jsonpath_parse(path)
-        matches = expr.find(spec)
-
-        if not matches:
-            return RequirementResult(
-                requirement_id=req.id,
-                passed=False,
-                message=f"Path '{path}' not found",
-                points_earned=0,
-                points_possible=req.points,
-            )
-
-        actual = str(matches[0].value)
-        passed = bool(re.match(pattern, actual))
+        actual = str(value)
+        passed = bool(rule.pattern.match(actual))
 
         return RequirementResult(
             requirement_id=req.id,
@@ -285,31 +287,16 @@ class ValidationService:
         )
 
     def _eval_schema_validates(
-        self, req: Requirement, config: dict[str, Any], spec: dict
+        self, req: Requirement, rule: RulePlan, context: EvaluationContext
     ) -> RequirementResult:
         """Validate a portion of the spec against a JSON schema."""
-        path = config["path"]
-        schema = config["schema"]
-
-        expr = jsonpath_parse(path)
-        matches = expr.find(spec)
+        value = context.first_match(rule)
+        if value is MISSING:
+            return self._path_not_found(req, rule)
 
-        if not matches:
-            return RequirementResult(
-                requirement_id=req.id,
-                passed=False,
-                message=f"Path '{path}' not found",
-                points_earned=0,
-                points_possible=req.points,
-            )
-
-        try:
-            json_validate(instance=matches[0].value, schema=schema)
-            passed = True
-            message = req.description
-        except JsonSchemaValidationError as e:
-            passed = False
-            message = f"Schema validation failed: {e.message}"
+        error = best_match(rule.schema_validator.iter_errors(value))
+        passed = error is None
+        message = req.description if passed else f"Schema validation failed: {error.message}"
 
         return RequirementResult(
             requirement_id=req.id,
@@ -320,23 +307,11 @@ class ValidationService:
         )
 
     def _eval_custom(
-        self, req: Requirement, config: dict[str, Any], spec: dict
+        self, req: Requirement, rule: RulePlan, context: EvaluationContext
     ) -> RequirementResult:
         """Run a custom validation function."""
-        validator_name = config["validator"]
-        validator_args = config.get("args", {})
-
-        validator = get_validator(validator_name)
-        if not validator:
-            return RequirementResult(
-                requirement_id=req.id,
-                passed=False,
-                message=f"Unknown custom validator: {validator_name}",
-                points_earned=0,
-                points_possible=req.points,
-            )
-
-        passed, message = validator(spec, **validator_args)
+        target = context.index if rule.validator_uses_index else context.spec
+        passed, message = rule.validator(target, **rule.validator_args)
 
         return RequirementResult(
             requirement_id=req.id,
@@ -346,6 +321,16 @@ class ValidationService:
             points_possible=req.points,
         )
 
+    def _path_not_found(self, req: Requirement, rule: RulePlan) -> RequirementResult:
+        """Build the failed result for a rule whose path has no match."""
+        return RequirementResult(
+            requirement_id=req.id,
+            passed=False,
+            message=f"Path '{rule.path}' not found",
+            points_earned=0,
+            points_possible=req.points,
+        )
+
     def _calculate_max_score(self, scenario: ScenarioFile) -> int:
         """Calculate maximum possible score."""
         return sum(req.points for req in scenario.requirements)
@@ -0,0 +1,20 @@
+"""Helpers for rendering locations inside a document as JSONPath strings."""
+
+import re
+from collections.abc import Iterable
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def format_json_path(parts: Iterable[str | int]) -> str:
+    """Render path segments as JSONPath, e.g. ``$.paths['/users'].get``."""
+    path = "$"
+    for part in parts:
+        if isinstance(part, int):
+            path += f"[{part}]"
+        elif _IDENTIFIER.match(part):
+            path += f".{part}"
+        else:
+            escaped = part.replace("\\", "\\\\").replace("'", "\\'")
+            path += f"['{escaped}']"
+    return path
@@ -0,0 +1,5 @@
+"""Performance benchmarks for the validation engine.
+
+Run a benchmark as a module from the backend directory, e.g.
+``python -m benchmarks.yaml_loader``.
+"""
@@ -0,0 +1,51 @@
+"""Sample OpenAPI documents shared by the benchmarks."""
+
+from pathlib import Path
+
+import yaml
+
+SCENARIOS_PATH = Path(__file__).parent.parent / "scenarios"
+
+
+def load_small_spec() -> dict:
+    """Return the example solution of a bundled scenario, a typical student spec."""
+    scenario = yaml.safe_load((SCENARIOS_PATH / "components-ref-001.yaml").read_text())
+    return yaml.safe_load(scenario["example_solution"])
+
+
+def build_large_spec(path_count: int) -> dict:
+    """Build a valid OpenAPI document with ``path_count`` paths."""
+    paths = {}
+    for i in range(path_count):
+        paths[f"/resource{i}/{{id}}"] = {
+            "get": {
+                "operationId": f"getResource{i}",
+                "parameters": [
+                    {"name": "id", "in": "path", "required": True, "schema": {"type": "integer"}}
+                ],
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/Resource"}
+                            }
+                        },
+                    }
+                },
+            }
+        }
+    spec = {
+        "openapi": "3.0.3",
+        "info": {"title": "Large API", "version": "1.0.0"},
+        "paths": paths,
+        "components": {
+            "schemas": {
+                "Resource": {
+                    "type": "object",
+                    "properties": {"id": {"type": "integer"}, "name": {"type": "string"}},
+                }
+            }
+        },
+    }
+    return spec
@@ -0,0 +1,71 @@
+"""Compare parse time of the pure-Python and libyaml loaders and the JSON fast path.
+
+Usage: python -m benchmarks.yaml_loader [--paths 2000] [--repeat 5]
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+import yaml
+
+from app.services.validation_service import ValidationService
+from benchmarks.specs import build_large_spec, load_small_spec
+
+
+def time_parse(service: ValidationService, content: str, repeat: int) -> list[float]:
+    """Return wall-clock seconds for each of ``repeat`` parses."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parsed, errors = service._parse_yaml(content)
+        timings.append(time.perf_counter() - start)
+        assert parsed is not None and not errors
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paths", type=int, default=2000, help="paths in the large spec")
+    parser.add_argument("--repeat", type=int, default=5, help="parses per measurement")
+    args = parser.parse_args()
+
+    loaders = {"SafeLoader": yaml.SafeLoader}
+    if hasattr(yaml, "CSafeLoader"):
+        loaders["CSafeLoader"] = yaml.CSafeLoader
+    else:
+        print("PyYAML was built without libyaml; only SafeLoader is measured")
+
+    small = yaml.safe_dump(load_small_spec(), sort_keys=False)
+    workloads = {
+        f"small ({len(small) / 1024:.1f} KiB)": small,
+    }
+    large = yaml.safe_dump(build_large_spec(args.paths), sort_keys=False)
+    workloads[f"large ({args.paths} paths, {len(large) / 1024:.0f} KiB)"] = large
+
+    print(f"{'workload':<36} {'loader':<12} {'median ms':>10} {'min ms':>10}")
+    for name, content in workloads.items():
+        medians = {}
+        for loader_name, loader in loaders.items():
+            timings = time_parse(ValidationService(yaml_loader=loader), content, args.repeat)
+            medians[loader_name] = statistics.median(timings)
+            print(
+                f"{name:<36} {loader_name:<12} "
+                f"{medians[loader_name] * 1000:>10.2f} {min(timings) * 1000:>10.2f}"
+            )
+        if len(medians) == 2:
+            speedup = medians["SafeLoader"] / medians["CSafeLoader"]
+            print(f"{'':<36} {'speedup':<12} {speedup:>9.1f}x")
+
+        # Same document submitted as JSON takes the json.loads fast path
+        as_json = json.dumps(yaml.safe_load(content))
+        timings = time_parse(ValidationService(), as_json, args.repeat)
+        print(
+            f"{name:<36} {'json':<12} "
+            f"{statistics.median(timings) * 1000:>10.2f} {min(timings) * 1000:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
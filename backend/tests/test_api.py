@@ -1,5 +1,7 @@
 """API endpoint tests."""
 
+import json
+
 
 def test_health_check(client):
     """Test the health endpoint."""
@@ -39,3 +41,94 @@ def test_get_nonexistent_scenario(client):
     """Test getting a scenario that doesn't exist."""
     response = client.get("/api/v1/scenarios/nonexistent-scenario")
     assert response.status_code == 404
+
+
+def test_validate_solution(client, sample_valid_openapi):
+    """Test validating a solution through the API."""
+    response = client.post(
+        "/api/v1/scenarios/paths-basic-001/validate",
+        json={"solution": sample_valid_openapi},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["max_score"] > 0
+    assert len(data["results"]) > 0
+
+
+def test_validate_nonexistent_scenario(client, sample_valid_openapi):
+    """Test validating against a scenario that doesn't exist."""
+    response = client.post(
+        "/api/v1/scenarios/nonexistent-scenario/validate",
+        json={"solution": sample_valid_openapi},
+    )
+    assert response.status_code == 404
+
+
+def test_repeated_validation_is_cached(client, sample_valid_openapi):
+    """Test that resubmitting an unchanged solution is served from the cache."""
+    url = "/api/v1/scenarios/paths-basic-001/validate"
+    payload = {"solution": sample_valid_openapi + "\n# cache test\n"}
+    hits_before = client.get("/api/v1/health").json()["validation_cache"]["hits"]
+
+    first = client.post(url, json=payload)
+    second = client.post(url, json=payload)
+
+    assert first.json() == second.json()
+    hits_after = client.get("/api/v1/health").json()["validation_cache"]["hits"]
+    assert hits_after == hits_before + 1
+
+
+def test_validate_batch(client, sample_valid_openapi):
+    """Test grading several solutions against one scenario."""
+    response = client.post(
+        "/api/v1/scenarios/paths-basic-001/validate/batch",
+        json={
+            "items": [
+                {"id": "alice", "solution": sample_valid_openapi},
+                {"id": "bob", "solution": "openapi: [unclosed"},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["id"] for item in data["items"]] == ["alice", "bob"]
+    assert data["items"][1]["result"]["syntax_errors"]
+    assert data["statistics"]["count"] == 2
+    assert data["statistics"]["min"] == 0
+
+
+def test_validate_batch_stream(client, sample_valid_openapi):
+    """Test grading an NDJSON stream of solutions."""
+    lines = [
+        json.dumps({"id": f"student-{i}", "solution": sample_valid_openapi}) for i in range(5)
+    ]
+    lines.append("not json")
+    response = client.post(
+        "/api/v1/scenarios/paths-basic-001/validate/batch/stream",
+        content="\n".join(lines),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    records = [json.loads(line) for line in response.text.splitlines()]
+
+    items, summary = records[:-1], records[-1]
+    assert len(items) == 6
+    assert {item["id"] for item in items if item["result"]} == {f"student-{i}" for i in range(5)}
+    assert [item["id"] for item in items if item["error"]] == ["line-6"]
+    assert summary["statistics"]["count"] == 5
+    assert summary["statistics"]["errors"] == 1
+
+
+def test_validate_across_scenarios(client, sample_valid_openapi):
+    """Test grading one solution against several scenarios."""
+    response = client.post(
+        "/api/v1/validate/batch",
+        json={
+            "solution": sample_valid_openapi,
+            "scenario_ids": ["paths-basic-001", "nonexistent-scenario"],
+        },
+    )
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert items[0]["result"] is not None
+    assert "not found" in items[1]["error"]
@@ -0,0 +1,95 @@
+"""Custom validator and spec index tests."""
+
+import pytest
+
+from app.services.custom_validators import (
+    get_validator,
+    has_path_parameter,
+    security_scheme_applied,
+    uses_component_ref,
+    validator_uses_index,
+)
+from app.services.spec_index import SpecIndex
+
+
+@pytest.fixture
+def spec_index():
+    """Index a spec with refs, parameters and security requirements."""
+    return SpecIndex(
+        {
+            "openapi": "3.0.3",
+            "security": [{"apiKey": []}],
+            "paths": {
+                "/users/{id}": {
+                    "parameters": [{"name": "id", "in": "path", "required": True}],
+                    "get": {
+                        "parameters": [{"name": "expand", "in": "query"}],
+                        "security": [{"oauth": ["read"]}],
+                        "responses": {
+                            "200": {
+                                "content": {
+                                    "application/json": {
+                                        "schema": {"$ref": "#/components/schemas/User"}
+                                    }
+                                }
+                            }
+                        },
+                    },
+                },
+                "/orgs/{orgId}": {
+                    "put": {"parameters": [{"name": "orgId", "in": "path"}]},
+                    "x-note": "not an operation",
+                },
+                "/broken": "not a path item",
+            },
+        }
+    )
+
+
+def test_index_tables(spec_index):
+    """Test the tables built by the spec index."""
+    assert spec_index.refs["#/components/schemas/User"] == [
+        (
+            "paths", "/users/{id}", "get", "responses", "200",
+            "content", "application/json", "schema",
+        )
+    ]
+    assert set(spec_index.operations) == {("/users/{id}", "get"), ("/orgs/{orgId}", "put")}
+    assert spec_index.parameters["path"][("/users/{id}", "id")] == [None]
+    assert spec_index.parameters["query"][("/users/{id}", "expand")] == ["get"]
+    assert spec_index.global_security == {"apiKey"}
+    assert spec_index.operation_security["oauth"] == [("/users/{id}", "get")]
+
+
+def test_builtin_validators_use_index():
+    """Test that the walking validators are registered to receive the index."""
+    for name in ("has_path_parameter", "uses_component_ref", "security_scheme_applied"):
+        assert validator_uses_index(name)
+    assert get_validator("has_operation_id") is not None
+    assert not validator_uses_index("has_operation_id")
+
+
+def test_has_path_parameter(spec_index):
+    """Test path parameters declared on the path item and on an operation."""
+    assert has_path_parameter(spec_index, "/users/{id}", "id") == (
+        True, "Path parameter 'id' found",
+    )
+    assert has_path_parameter(spec_index, "/orgs/{orgId}", "orgId") == (
+        True, "Path parameter 'orgId' found in PUT",
+    )
+    assert has_path_parameter(spec_index, "/users/{id}", "expand")[0] is False
+
+
+def test_uses_component_ref(spec_index):
+    """Test component reference lookup."""
+    assert uses_component_ref(spec_index, "schemas", "User")[0] is True
+    assert uses_component_ref(spec_index, "schemas", "Org")[0] is False
+
+
+def test_security_scheme_applied(spec_index):
+    """Test global and operation-level security requirements."""
+    assert security_scheme_applied(spec_index, "apiKey")[0] is True
+    assert security_scheme_applied(spec_index, "oauth")[0] is False
+    assert security_scheme_applied(spec_index, "oauth", scope="operation") == (
+        True, "Security scheme 'oauth' applied to GET /users/{id}",
+    )
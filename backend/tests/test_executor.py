@@ -0,0 +1,37 @@
+"""Validation executor tests."""
+
+import pytest
+
+from app.config import settings
+from app.models.validation import ValidationRequest
+from app.services.executor import ExecutionBackend, ValidationExecutor
+from app.services.scenario_service import ScenarioService
+from app.services.validation_service import ValidationService
+
+
+@pytest.fixture(scope="module")
+def scenario_service():
+    """Load the bundled scenarios."""
+    return ScenarioService(settings.scenarios_path)
+
+
+@pytest.mark.parametrize("backend", list(ExecutionBackend))
+async def test_backends_agree(scenario_service, backend):
+    """Test that every backend returns the same result as direct validation."""
+    scenario = scenario_service.get_scenario("components-ref-001")
+    plan = scenario_service.get_plan(scenario.id)
+    request = ValidationRequest(solution=scenario.example_solution)
+    expected = ValidationService().validate_solution(scenario, request, plan)
+
+    executor = ValidationExecutor(
+        ValidationService(),
+        backend=backend,
+        workers=1,
+        scenarios_path=settings.scenarios_path,
+    )
+    try:
+        result = await executor.validate(scenario, request, plan)
+    finally:
+        executor.shutdown()
+
+    assert result == expected
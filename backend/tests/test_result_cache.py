@@ -0,0 +1,70 @@
+"""Validation result cache tests."""
+
+from app.models.validation import ValidationResponse
+from app.services.result_cache import ValidationResultCache
+
+
+def make_response(score: int) -> ValidationResponse:
+    """Build a minimal validation response."""
+    return ValidationResponse(
+        valid=True,
+        score=score,
+        max_score=score,
+        results=[],
+        feedback="",
+        syntax_errors=[],
+        warnings=[],
+    )
+
+
+def test_hit_and_miss_counters():
+    """Test that lookups are counted as hits or misses."""
+    cache = ValidationResultCache(max_entries=10)
+    key = cache.make_key("scenario", "hash-1", "openapi: 3.0.3")
+
+    assert cache.get(key) is None
+    cache.put(key, make_response(5))
+    assert cache.get(key).score == 5
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+
+
+def test_lru_eviction():
+    """Test that the least recently used entry is evicted when full."""
+    cache = ValidationResultCache(max_entries=2)
+    keys = [cache.make_key("scenario", "hash-1", f"solution {i}") for i in range(3)]
+
+    cache.put(keys[0], make_response(0))
+    cache.put(keys[1], make_response(1))
+    cache.get(keys[0])
+    cache.put(keys[2], make_response(2))
+
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiry():
+    """Test that entries older than the TTL are not served."""
+    cache = ValidationResultCache(max_entries=10, ttl_seconds=0)
+    key = cache.make_key("scenario", "hash-1", "solution")
+    cache.put(key, make_response(1))
+
+    assert cache.get(key) is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_scenario_change_invalidates_entries():
+    """Test that a new scenario content hash drops results for the old one."""
+    cache = ValidationResultCache(max_entries=10)
+    old_key = cache.make_key("scenario", "hash-1", "solution")
+    cache.put(old_key, make_response(1))
+    cache.put(cache.make_key("other", "hash-9", "solution"), make_response(2))
+
+    new_key = cache.make_key("scenario", "hash-2", "solution")
+    assert cache.get(new_key) is None
+    assert cache.stats()["size"] == 1
+    assert cache.get(old_key) is None
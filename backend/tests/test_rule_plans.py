@@ -0,0 +1,100 @@
+"""Rule plan compilation tests."""
+
+import pytest
+import yaml
+from jsonpath_ng.ext import parse as jsonpath_parse
+
+from app.config import settings
+from app.models.scenario import ValidationRule
+from app.services.path_trie import PathTrie, simple_path_keys
+from app.services.rule_plans import RuleCompilationError, compile_rule
+from app.services.scenario_service import ScenarioService
+
+
+def test_compile_simple_path_rule():
+    """Test that simple JSONPaths compile to direct key lookups."""
+    plan = compile_rule(
+        ValidationRule(type="json_path_exists", config={"path": "$.paths['/users'].get"})
+    )
+    assert plan.path == "$.paths['/users'].get"
+    assert plan.keys == ("paths", "/users", "get")
+    assert plan.expr is None
+
+
+def test_compile_filter_expression():
+    """Test that filter expressions used by scenarios compile."""
+    plan = compile_rule(
+        ValidationRule(
+            type="json_path_exists",
+            config={"path": "$.parameters[?(@.name=='limit' & @.in=='query')]"},
+        )
+    )
+    spec = {"parameters": [{"name": "limit", "in": "query"}]}
+    assert plan.keys is None
+    assert plan.expr.find(spec)
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        ValidationRule(type="json_path_exists", config={"path": "$.paths[?"}),
+        ValidationRule(type="json_path_matches", config={"path": "$.info", "pattern": "("}),
+        ValidationRule(type="json_path_equals", config={"path": "$.info"}),
+        ValidationRule(type="schema_validates", config={"path": "$", "schema": {"type": 5}}),
+        ValidationRule(type="custom", config={"validator": "no_such_validator"}),
+        ValidationRule(
+            type="custom",
+            config={"validator": "has_path_parameter", "args": {"unknown": "x"}},
+        ),
+        ValidationRule(type="not_a_rule", config={}),
+    ],
+)
+def test_invalid_rules_fail_at_compile_time(rule):
+    """Test that bad paths, patterns, schemas and validators are rejected."""
+    with pytest.raises(RuleCompilationError):
+        compile_rule(rule)
+
+
+@pytest.mark.parametrize(
+    ("path", "keys"),
+    [
+        ("$", ()),
+        ("$.info.title", ("info", "title")),
+        (
+            "$.paths['/users/{id}'].get.parameters[0].in",
+            ("paths", "/users/{id}", "get", "parameters", 0, "in"),
+        ),
+        ("$.paths.*", None),
+        ("$..schema", None),
+        ("$.tags[*].name", None),
+        ("$.tags[-1]", None),
+        ("$.info['title','version']", None),
+    ],
+)
+def test_simple_path_keys(path, keys):
+    """Test which JSONPaths are simple enough for direct lookups."""
+    assert simple_path_keys(jsonpath_parse(path)) == keys
+
+
+def test_path_trie_matches_jsonpath():
+    """Test that trie lookups agree with jsonpath_ng on every bundled scenario."""
+    scenario_service = ScenarioService(settings.scenarios_path)
+    for scenario_id, scenario in scenario_service.scenarios.items():
+        plan = scenario_service.get_plan(scenario_id)
+        for solution in (scenario.example_solution, scenario.starter_code):
+            spec = yaml.safe_load(solution)
+            found = plan.path_trie.resolve(spec)
+            for rule in plan.rules:
+                if rule.keys is None:
+                    continue
+                matches = jsonpath_parse(rule.path).find(spec)
+                assert (rule.keys in found) == bool(matches), rule.path
+                if matches:
+                    assert found[rule.keys] == matches[0].value
+
+
+def test_path_trie_type_checks():
+    """Test that names only match mappings and indices only match lists."""
+    trie = PathTrie([("a", "b"), ("a", 0), ("c", 1)])
+    assert trie.resolve({"a": [{"b": 1}], "c": [5, 6]}) == {("a", 0): {"b": 1}, ("c", 1): 6}
+    assert trie.resolve({"a": {"b": None, 0: "x"}}) == {("a", "b"): None}
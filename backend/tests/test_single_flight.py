@@ -0,0 +1,63 @@
+"""Single-flight coalescing tests."""
+
+import asyncio
+
+import pytest
+
+from app.services.single_flight import SingleFlight
+
+
+async def test_concurrent_calls_share_one_computation():
+    """Test that concurrent callers with the same key run the work once."""
+    flight = SingleFlight()
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "result"
+
+    results = await asyncio.gather(*(flight.run("key", compute) for _ in range(20)))
+
+    assert results == ["result"] * 20
+    assert calls == 1
+    assert flight.stats() == {"in_flight": 0, "started": 1, "coalesced": 19}
+
+
+async def test_errors_are_shared_and_not_cached():
+    """Test that a failure reaches every waiter and the next call retries."""
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flight.run("key", fail), flight.run("key", fail), return_exceptions=True
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+
+    async def succeed():
+        return "ok"
+
+    assert await flight.run("key", succeed) == "ok"
+
+
+async def test_cancelled_caller_does_not_cancel_shared_work():
+    """Test that the first caller going away leaves other waiters unaffected."""
+    flight = SingleFlight()
+
+    async def compute():
+        await asyncio.sleep(0.02)
+        return "result"
+
+    leader = asyncio.ensure_future(flight.run("key", compute))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flight.run("key", compute))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "result"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
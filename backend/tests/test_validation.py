@@ -1,9 +1,12 @@
 """Validation service tests."""
 
 import pytest
+import yaml
 
+from app.config import settings
 from app.models.scenario import Difficulty, Requirement, ScenarioFile, Topic, ValidationRule
 from app.models.validation import ValidationRequest
+from app.services.scenario_service import ScenarioService
 from app.services.validation_service import ValidationService
 
 
@@ -116,3 +119,78 @@ paths:
     # First requirement passes, second fails
     assert result.results[0].passed is True
     assert result.results[1].passed is False
+
+
+def test_example_solutions_score_full_marks(validation_service):
+    """Test that every bundled scenario accepts its own example solution."""
+    scenario_service = ScenarioService(settings.scenarios_path)
+    assert scenario_service.scenarios
+
+    for scenario_id, scenario in scenario_service.scenarios.items():
+        request = ValidationRequest(solution=scenario.example_solution)
+        plan = scenario_service.get_plan(scenario_id)
+        result = validation_service.validate_solution(scenario, request, plan)
+        assert result.score == result.max_score, scenario_id
+
+
+@pytest.mark.parametrize(
+    "loader", [yaml.SafeLoader, getattr(yaml, "CSafeLoader", yaml.SafeLoader)]
+)
+def test_syntax_error_position_is_loader_independent(loader, sample_invalid_yaml):
+    """Test that the pure-Python and libyaml loaders report the same position."""
+    service = ValidationService(yaml_loader=loader)
+    parsed, errors = service._parse_yaml(sample_invalid_yaml)
+
+    assert parsed is None
+    assert (errors[0].line, errors[0].column) == (7, 1)
+
+
+def test_json_solution(validation_service, sample_scenario):
+    """Test that solutions submitted as JSON are accepted."""
+    solution = (
+        '{"openapi": "3.0.3", "info": {"title": "Test API", "version": "1.0.0"},'
+        ' "paths": {"/users": {"get": {"responses": {"200": {"description": "OK"}}}}}}'
+    )
+    result = validation_service.validate_solution(
+        sample_scenario, ValidationRequest(solution=solution)
+    )
+
+    assert result.valid is True
+    assert result.score == 10
+
+
+def test_invalid_json_reports_json_position(validation_service):
+    """Test that malformed JSON reports the JSON decoder's line and column."""
+    parsed, errors = validation_service._parse_yaml('{\n  "openapi": "3.0.3",\n  "info": }')
+
+    assert parsed is None
+    assert (errors[0].line, errors[0].column) == (3, 11)
+    assert errors[0].message.startswith("Invalid JSON")
+
+
+def test_yaml_flow_mapping_is_not_treated_as_json(validation_service):
+    """Test that YAML flow mappings still parse after the JSON attempt fails."""
+    parsed, errors = validation_service._parse_yaml("{openapi: 3.0.3, paths: {}}")
+
+    assert errors == []
+    assert parsed == {"openapi": "3.0.3", "paths": {}}
+
+
+def test_structure_errors_are_all_reported_with_paths(validation_service):
+    """Test that every structural error becomes a warning with a JSONPath."""
+    spec = {
+        "openapi": "3.0.3",
+        "info": {"title": "Test API"},
+        "paths": {"/users": {"get": {"responses": {"200": {}}}}},
+    }
+    warnings = validation_service._validate_openapi_structure(spec)
+    paths = {w.path for w in warnings}
+
+    assert "$.info" in paths
+    assert "$.paths['/users'].get.responses['200']" in paths
+
+
+def test_valid_structure_has_no_warnings(validation_service, sample_valid_openapi):
+    """Test that a valid document produces no structural warnings."""
+    spec = yaml.safe_load(sample_valid_openapi)
+    assert validation_service._validate_openapi_structure(spec) == []